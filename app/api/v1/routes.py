@@ -1,7 +1,13 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
+
+from app.core.config import configs
+from app.core.dependencies import async_unit_of_work, unit_of_work
 
 #from app.api.v1.endpoints.auth import router as auth_router
-from app.api.v1.endpoints.task import router as task_router
+if configs.DB_ASYNC:
+    from app.api.v1.endpoints.task_async import router as task_router
+else:
+    from app.api.v1.endpoints.task import router as task_router
 # user endpoints are removed from v1
 
 routers = APIRouter()
@@ -12,4 +18,4 @@ for router in router_list:
     # Ensure tags contains version info and keep any existing tags
     existing = getattr(router, "tags", None) or []
     router.tags = existing + ["v1"]
-    routers.include_router(router)
+    routers.include_router(router, dependencies=[Depends(async_unit_of_work if configs.DB_ASYNC else unit_of_work)])
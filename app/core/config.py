@@ -28,6 +28,10 @@ class Configs(BaseSettings):
         "postgresql": "postgresql",
         "mysql": "mysql+pymysql",
     }
+    DB_ASYNC_ENGINE_MAPPER: dict = {
+        "postgresql": "postgresql+asyncpg",
+        "mysql": "mysql+aiomysql",
+    }
 
     PROJECT_ROOT: str = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -70,6 +74,28 @@ class Configs(BaseSettings):
         database=ENV_DATABASE_MAPPER[ENV],
     )
 
+    # connection pool (applies to both the sync and the async engine)
+    DB_ECHO: bool = os.getenv("DB_ECHO", "false").lower() == "true"
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "5"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    DB_POOL_TIMEOUT: float = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+    # seconds before a connection is replaced; -1 disables recycling
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+
+    # Serve task routes from the asyncio stack (create_async_engine + asyncpg/aiomysql)
+    DB_ASYNC: bool = os.getenv("DB_ASYNC", "false").lower() == "true"
+    DB_ASYNC_ENGINE: str = DB_ASYNC_ENGINE_MAPPER[DB]
+
+    ASYNC_DATABASE_URI: str = DATABASE_URI_FORMAT.format(
+        db_engine=DB_ASYNC_ENGINE,
+        user=DB_USER,
+        password=DB_PASSWORD,
+        host=DB_HOST,
+        port=DB_PORT,
+        database=ENV_DATABASE_MAPPER[ENV],
+    )
+
     # find query
     PAGE: int = 1
     PAGE_SIZE: int = 20
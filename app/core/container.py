@@ -2,22 +2,28 @@ from dependency_injector import containers, providers
 
 from app.core.config import configs
 from app.core.database import Database
-from app.repository.user_repository import UserRepository
-from app.repository.task_repository import TaskRepository
+from app.repository.user_repository import AsyncUserRepository, UserRepository
+from app.repository.task_repository import AsyncTaskRepository, TaskRepository
 from app.services import AuthService, UserService
-from app.services.task_service import TaskService
+from app.services.task_service import AsyncTaskService, TaskService
+from app.services.user_service import AsyncUserService
 
 
 class Container(containers.DeclarativeContainer):
     wiring_config = containers.WiringConfiguration(
         modules=[
             "app.api.v1.endpoints.task",
+            "app.api.v1.endpoints.task_async",
             "app.api.v2.endpoints.auth",
             "app.core.dependencies",
         ]
     )
 
-    db = providers.Singleton(Database, db_url=configs.DATABASE_URI)
+    db = providers.Singleton(
+        Database,
+        db_url=configs.DATABASE_URI,
+        async_db_url=configs.ASYNC_DATABASE_URI if configs.DB_ASYNC else None,
+    )
 
     user_repository = providers.Factory(UserRepository, session_factory=db.provided.session)
     task_repository = providers.Factory(TaskRepository, session_factory=db.provided.session)
@@ -26,3 +32,10 @@ class Container(containers.DeclarativeContainer):
 
     user_service = providers.Factory(UserService, user_repository=user_repository)
     task_service = providers.Factory(TaskService, task_repository=task_repository)
+
+    # asyncio stack, only usable when configs.DB_ASYNC is enabled
+    async_user_repository = providers.Factory(AsyncUserRepository, session_factory=db.provided.async_session)
+    async_task_repository = providers.Factory(AsyncTaskRepository, session_factory=db.provided.async_session)
+
+    async_user_service = providers.Factory(AsyncUserService, user_repository=async_user_repository)
+    async_task_service = providers.Factory(AsyncTaskService, task_repository=async_task_repository)
@@ -1,9 +1,18 @@
-from contextlib import AbstractContextManager, contextmanager
-from typing import Any, Generator
+import threading
+import time
+from bisect import bisect_left
+from contextlib import AbstractContextManager, asynccontextmanager, contextmanager
+from contextvars import ContextVar, Token
+from typing import Any, AsyncGenerator, Generator, Optional, Tuple, Type
 
-from sqlalchemy import create_engine, orm
+from sqlalchemy import create_engine, event, orm
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import as_declarative, declared_attr
 from sqlalchemy.orm import Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.core.config import configs
 
 
 @as_declarative()
@@ -17,27 +26,250 @@ class BaseModel:
         return cls.__name__.lower()
 
 
+# Session owned by the unit of work of the current request, if any. Repositories
+# entering Database.session()/async_session() while it is set share it.
+_request_session: ContextVar[Optional[Session]] = ContextVar("request_session", default=None)
+_request_async_session: ContextVar[Optional[AsyncSession]] = ContextVar("request_async_session", default=None)
+
+
+@event.listens_for(Session, "after_flush")
+def _flag_flush(session: Session, flush_context: Any) -> None:
+    session.info["has_writes"] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _flag_dml(orm_execute_state: orm.ORMExecuteState) -> None:
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info["has_writes"] = True
+
+
+class PoolStats:
+    """Checkout counters and latency histogram for one connection pool."""
+
+    # upper bounds in milliseconds, an implicit +Inf bucket follows
+    BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.waits = 0
+        self.timeouts = 0
+        self.wait_time_ms = 0.0
+        self.max_wait_ms = 0.0
+        self._buckets = [0] * (len(self.BUCKETS_MS) + 1)
+
+    def record_checkout(self, elapsed_ms: float, waited: bool, timed_out: bool = False) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self._buckets[bisect_left(self.BUCKETS_MS, elapsed_ms)] += 1
+            if timed_out:
+                self.timeouts += 1
+            if waited:
+                self.waits += 1
+                self.wait_time_ms += elapsed_ms
+                self.max_wait_ms = max(self.max_wait_ms, elapsed_ms)
+
+    def snapshot(self, pool: QueuePool) -> dict:
+        with self._lock:
+            cumulative, histogram = 0, {}
+            for bound, count in zip(self.BUCKETS_MS + ("+Inf",), self._buckets):
+                cumulative += count
+                histogram[str(bound)] = cumulative
+            return {
+                "size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "checked_in": pool.checkedin(),
+                "overflow": pool.overflow(),
+                "checkouts": self.checkouts,
+                "waits": self.waits,
+                "timeouts": self.timeouts,
+                "wait_time_ms": round(self.wait_time_ms, 3),
+                "max_wait_ms": round(self.max_wait_ms, 3),
+                "checkout_latency_ms": histogram,
+            }
+
+
+def _instrumented_pool_class(base: Type[QueuePool], stats: PoolStats) -> Type[QueuePool]:
+    """Subclass ``base`` so every checkout is timed into ``stats``.
+
+    A subclass (rather than pool events) is needed because SQLAlchemy only
+    fires ``checkout`` once a connection was obtained, so the time spent
+    queueing for one is invisible to listeners. ``Pool.recreate`` keeps the
+    class, so the instrumentation survives ``engine.dispose()``.
+    """
+
+    def _do_get(self):
+        # Only a pool at capacity blocks on its queue; an empty idle list below
+        # size + max_overflow just opens a new connection.
+        waited = (
+            self._max_overflow > -1
+            and self.checkedin() == 0
+            and self.checkedout() >= self.size() + self._max_overflow
+        )
+        start = time.perf_counter()
+        timed_out = False
+        try:
+            return base._do_get(self)
+        except PoolTimeoutError:
+            timed_out = True
+            raise
+        finally:
+            stats.record_checkout((time.perf_counter() - start) * 1000, waited, timed_out)
+
+    return type(f"Instrumented{base.__name__}", (base,), {"_do_get": _do_get})
+
+
 class Database:
-    def __init__(self, db_url: str) -> None:
-        self._engine = create_engine(db_url, echo=True)
-        self._session_factory = orm.scoped_session(
-            orm.sessionmaker(
-                autocommit=False,
-                autoflush=False,
-                bind=self._engine,
-            ),
+    def __init__(
+        self,
+        db_url: str,
+        async_db_url: Optional[str] = None,
+        echo: bool = configs.DB_ECHO,
+        pool_size: int = configs.DB_POOL_SIZE,
+        max_overflow: int = configs.DB_MAX_OVERFLOW,
+        pool_timeout: float = configs.DB_POOL_TIMEOUT,
+        pool_recycle: int = configs.DB_POOL_RECYCLE,
+        pool_pre_ping: bool = configs.DB_POOL_PRE_PING,
+    ) -> None:
+        pool_options = dict(
+            echo=echo,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=pool_timeout,
+            pool_recycle=pool_recycle,
+            pool_pre_ping=pool_pre_ping,
+        )
+        self._pool_stats = PoolStats()
+        self._engine = create_engine(
+            db_url,
+            poolclass=_instrumented_pool_class(QueuePool, self._pool_stats),
+            **pool_options,
+        )
+        self._sessionmaker = orm.sessionmaker(
+            autocommit=False,
+            autoflush=False,
+            bind=self._engine,
+            # results are serialized after the owning session committed
+            expire_on_commit=False,
         )
+        self._session_factory = orm.scoped_session(self._sessionmaker)
+
+        # The async engine is only built when asked for, so the sync-only
+        # deployment does not need an async driver installed.
+        self._async_engine = None
+        self._async_session_factory = None
+        self._async_pool_stats = None
+        if async_db_url:
+            self._async_pool_stats = PoolStats()
+            self._async_engine = create_async_engine(
+                async_db_url,
+                poolclass=_instrumented_pool_class(AsyncAdaptedQueuePool, self._async_pool_stats),
+                **pool_options,
+            )
+            self._async_session_factory = async_sessionmaker(
+                bind=self._async_engine,
+                autoflush=False,
+                # objects are read after commit, outside of the greenlet bridge
+                expire_on_commit=False,
+            )
 
     def create_database(self) -> None:
         BaseModel.metadata.create_all(self._engine)
 
+    def pool_status(self) -> dict:
+        status = {"sync": self._pool_stats.snapshot(self._engine.pool)}
+        if self._async_engine is not None:
+            status["async"] = self._async_pool_stats.snapshot(self._async_engine.pool)
+        return status
+
     @contextmanager
     def session(self) -> Generator[Any, Any, AbstractContextManager[Session]]:
+        request_session = _request_session.get()
+        if request_session is not None:
+            # the unit of work commits and closes it
+            yield request_session
+            return
+        # Outside a unit of work only sessions that wrote are committed; a
+        # read-only one is just closed, which returns its connection as before.
         session: Session = self._session_factory()
         try:
             yield session
+            if session.info.pop("has_writes", False):
+                session.commit()
         except Exception:
             session.rollback()
             raise
         finally:
+            session.info.pop("has_writes", None)
             session.close()
+
+    @asynccontextmanager
+    async def async_session(self) -> AsyncGenerator[AsyncSession, None]:
+        if self._async_session_factory is None:
+            raise RuntimeError("Database was created without an async_db_url")
+        request_session = _request_async_session.get()
+        if request_session is not None:
+            yield request_session
+            return
+        session: AsyncSession = self._async_session_factory()
+        try:
+            yield session
+            if session.info.pop("has_writes", False):
+                await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+        finally:
+            session.info.pop("has_writes", None)
+            await session.close()
+
+    def begin_unit_of_work(self) -> Tuple[Session, Token]:
+        """Open the session every ``session()`` call shares until ``end_unit_of_work``.
+
+        Split from the commit so the request dependency can bind the session in
+        the event loop context while running the blocking commit in a thread.
+        """
+        session: Session = self._sessionmaker()
+        return session, _request_session.set(session)
+
+    def end_unit_of_work(self, token: Token) -> None:
+        _request_session.reset(token)
+
+    @contextmanager
+    def unit_of_work(self) -> Generator[Session, None, None]:
+        """Run the block in one session and one transaction, committed at the end."""
+        session, token = self.begin_unit_of_work()
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            self.end_unit_of_work(token)
+            session.close()
+
+    @asynccontextmanager
+    async def async_unit_of_work(self) -> AsyncGenerator[AsyncSession, None]:
+        if self._async_session_factory is None:
+            raise RuntimeError("Database was created without an async_db_url")
+        session: AsyncSession = self._async_session_factory()
+        token = _request_async_session.set(session)
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+        finally:
+            _request_async_session.reset(token)
+            await session.close()
+
+    async def disconnect(self) -> None:
+        if self._async_engine is not None:
+            await self._async_engine.dispose()
+        self._engine.dispose()
+
+
+def in_unit_of_work() -> bool:
+    return _request_session.get() is not None or _request_async_session.get() is not None
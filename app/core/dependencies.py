@@ -1,15 +1,43 @@
 from dependency_injector.wiring import Provide, inject
 from fastapi import Depends
+from fastapi.concurrency import run_in_threadpool
 from jose import jwt
 from pydantic import ValidationError
 
 from app.core.config import configs
 from app.core.container import Container
+from app.core.database import Database
 from app.core.exceptions import AuthError
 from app.core.security import ALGORITHM, JWTBearer
 from app.model.user import User
 from app.schema.auth_schema import Payload
-from app.services.user_service import UserService
+from app.services.user_service import AsyncUserService, UserService
+
+
+@inject
+async def unit_of_work(db: Database = Depends(Provide[Container.db])):
+    """Share one session and one transaction across the whole request.
+
+    Declared async so the session is bound in the request context, which the
+    sync endpoint and dependencies inherit when FastAPI runs them in threads.
+    The exit runs before the response is sent, so a failed commit is reported.
+    """
+    session, token = db.begin_unit_of_work()
+    try:
+        yield session
+        await run_in_threadpool(session.commit)
+    except Exception:
+        await run_in_threadpool(session.rollback)
+        raise
+    finally:
+        db.end_unit_of_work(token)
+        await run_in_threadpool(session.close)
+
+
+@inject
+async def async_unit_of_work(db: Database = Depends(Provide[Container.db])):
+    async with db.async_unit_of_work() as session:
+        yield session
 
 
 @inject
@@ -28,6 +56,22 @@ def get_current_user(
     return current_user
 
 
+@inject
+async def get_current_user_async(
+    token: str = Depends(JWTBearer()),
+    service: AsyncUserService = Depends(Provide[Container.async_user_service]),
+) -> User:
+    try:
+        payload = jwt.decode(token, configs.SECRET_KEY, algorithms=ALGORITHM)
+        token_data = Payload(**payload)
+    except (jwt.JWTError, ValidationError):
+        raise AuthError(detail="Could not validate credentials")
+    current_user: User = await service.get_by_id(token_data.id)
+    if not current_user:
+        raise AuthError(detail="User not found")
+    return current_user
+
+
 def get_current_active_user(current_user: User = Depends(get_current_user)) -> User:
     if not current_user.is_active:
         raise AuthError("Inactive user")
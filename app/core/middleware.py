@@ -8,6 +8,7 @@ from fastapi import Request
 from loguru import logger
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from app.core.database import in_unit_of_work
 from app.services.base_service import BaseService
 
 
@@ -17,7 +18,8 @@ def inject(func):
     def wrapper(*args, **kwargs):
         result = func(*args, **kwargs)
         injected_services = [arg for arg in kwargs.values() if isinstance(arg, BaseService)]
-        if injected_services:
+        # the request unit of work closes its own session after committing
+        if injected_services and not in_unit_of_work():
             try:
                 injected_services[-1].close_scoped_session()
             except Exception as e:
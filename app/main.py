@@ -1,12 +1,13 @@
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
 from starlette.middleware.cors import CORSMiddleware
 
 from app.api.v1.routes import routers as v1_routers
 from app.api.v2.routes import routers as v2_routers
 from app.core.config import configs
 from app.core.container import Container
+from app.core.dependencies import get_current_super_user
 from app.core.logging import setup_logging
 from app.core.middleware import RequestLoggingMiddleware
 from app.util.class_object import singleton
@@ -32,6 +33,7 @@ class AppCreator:
                 yield
             finally:
                 # place any shutdown cleanup here
+                await self.db.disconnect()
                 logger.info("Application shutdown")
 
         # set app default
@@ -60,6 +62,11 @@ class AppCreator:
         def root():
             return "service is working"
 
+        @self.app.get("/pool-stats", include_in_schema=False, dependencies=[Depends(get_current_super_user)])
+        def pool_stats():
+            # connection pool occupancy and checkout latency, for sizing against worker count
+            return self.db.pool_status()
+
         self.app.include_router(v1_routers, prefix=configs.API_V1_STR)
         self.app.include_router(v2_routers, prefix=configs.API_V2_STR)
 
@@ -1,8 +1,11 @@
-from contextlib import AbstractContextManager
-from typing import Any, Callable, Type, TypeVar
+from contextlib import AbstractAsyncContextManager, AbstractContextManager
+from typing import Any, Callable, Tuple, Type, TypeVar
 
+from sqlalchemy import delete, func, select, update
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.sql import Select
 
 from app.core.config import configs
 from app.core.exceptions import DuplicatedError, NotFoundError
@@ -13,55 +16,77 @@ from loguru import logger
 T = TypeVar("T", bound=BaseModel)
 
 
-class BaseRepository:
-    def __init__(self, session_factory: Callable[..., AbstractContextManager[Session]], model: Type[T]) -> None:
+class RepositoryStatements:
+    """Statement builders shared by :class:`BaseRepository` and :class:`AsyncBaseRepository`."""
+
+    def __init__(self, session_factory: Callable[..., Any], model: Type[T]) -> None:
         self.session_factory = session_factory
         self.model = model
 
+    def _eager_options(self, eager: bool) -> list:
+        if not eager:
+            return []
+        return [joinedload(getattr(self.model, name)) for name in getattr(self.model, "eagers", [])]
+
+    def _read_by_options_statements(self, schema: T, eager: bool = False) -> Tuple[Select, Select, dict]:
+        """Build the page query, the count query and the search options for ``schema``."""
+        schema_as_dict: dict = schema.dict(exclude_none=True)
+        ordering: str = schema_as_dict.get("ordering", configs.ORDERING)
+        order_query = (
+            getattr(self.model, ordering[1:]).desc()
+            if ordering.startswith("-")
+            else getattr(self.model, ordering).asc()
+        )
+        page = schema_as_dict.get("page", configs.PAGE)
+        page_size = schema_as_dict.get("page_size", configs.PAGE_SIZE)
+        filter_options = dict_to_sqlalchemy_filter_options(self.model, schema_as_dict)
+        statement = select(self.model).options(*self._eager_options(eager)).where(filter_options).order_by(order_query)
+        if page_size != "all":
+            statement = statement.limit(page_size).offset((page - 1) * page_size)
+        count_statement = select(func.count()).select_from(self.model).where(filter_options)
+        search_options = {
+            "page": page,
+            "page_size": page_size,
+            "ordering": ordering,
+        }
+        return statement, count_statement, search_options
+
+    def _read_by_id_statement(self, id: int, eager: bool = False) -> Select:
+        return select(self.model).options(*self._eager_options(eager)).where(self.model.id == id)
+
+    def _reload_statement(self, id: int) -> Select:
+        # the session may already hold the row from earlier in the unit of work
+        return self._read_by_id_statement(id).execution_options(populate_existing=True)
+
+
+class BaseRepository(RepositoryStatements):
+    def __init__(self, session_factory: Callable[..., AbstractContextManager[Session]], model: Type[T]) -> None:
+        super().__init__(session_factory, model)
+
+    def _reload(self, session: Session, id: int):
+        query = session.execute(self._reload_statement(id)).scalars().first()
+        if not query:
+            raise NotFoundError(detail=f"not found id : {id}")
+        return query
+
     def read_by_options(self, schema: T, eager: bool = False) -> dict:
         with self.session_factory() as session:
             logger.bind(model=self.model.__name__).debug("read_by_options start")
-            schema_as_dict: dict = schema.dict(exclude_none=True)
-            ordering: str = schema_as_dict.get("ordering", configs.ORDERING)
-            order_query = (
-                getattr(self.model, ordering[1:]).desc()
-                if ordering.startswith("-")
-                else getattr(self.model, ordering).asc()
-            )
-            page = schema_as_dict.get("page", configs.PAGE)
-            page_size = schema_as_dict.get("page_size", configs.PAGE_SIZE)
-            filter_options = dict_to_sqlalchemy_filter_options(self.model, schema.dict(exclude_none=True))
-            query = session.query(self.model)
-            if eager:
-                for eager in getattr(self.model, "eagers", []):
-                    query = query.options(joinedload(getattr(self.model, eager)))
-            filtered_query = query.filter(filter_options)
-            query = filtered_query.order_by(order_query)
-            if page_size == "all":
-                query = query.all()
-            else:
-                query = query.limit(page_size).offset((page - 1) * page_size).all()
-            total_count = filtered_query.count()
+            statement, count_statement, search_options = self._read_by_options_statements(schema, eager)
+            founds = session.execute(statement).scalars()
+            founds = founds.unique().all() if eager else founds.all()
+            total_count = session.execute(count_statement).scalar_one()
             result = {
-                "founds": query,
-                "search_options": {
-                    "page": page,
-                    "page_size": page_size,
-                    "ordering": ordering,
-                    "total_count": total_count,
-                },
+                "founds": founds,
+                "search_options": {**search_options, "total_count": total_count},
             }
-            logger.bind(model=self.model.__name__, count=len(query)).debug("read_by_options done")
+            logger.bind(model=self.model.__name__, count=len(founds)).debug("read_by_options done")
             return result
 
     def read_by_id(self, id: int, eager: bool = False):
         with self.session_factory() as session:
             logger.bind(model=self.model.__name__, id=id).debug("read_by_id start")
-            query = session.query(self.model)
-            if eager:
-                for eager in getattr(self.model, "eagers", []):
-                    query = query.options(joinedload(getattr(self.model, eager)))
-            query = query.filter(self.model.id == id).first()
+            query = session.execute(self._read_by_id_statement(id, eager)).scalars().first()
             if not query:
                 raise NotFoundError(detail=f"not found id : {id}")
             logger.bind(model=self.model.__name__, id=id).debug("read_by_id done")
@@ -73,7 +98,7 @@ class BaseRepository:
             query = self.model(**schema.dict())
             try:
                 session.add(query)
-                session.commit()
+                session.flush()
                 session.refresh(query)
             except IntegrityError as e:
                 logger.exception("create failed due to integrity error")
@@ -84,40 +109,116 @@ class BaseRepository:
     def update(self, id: int, schema: T):
         with self.session_factory() as session:
             logger.bind(model=self.model.__name__, id=id).debug("update start")
-            session.query(self.model).filter(self.model.id == id).update(schema.dict(exclude_none=True))
-            session.commit()
-            result = self.read_by_id(id)
+            session.execute(update(self.model).where(self.model.id == id).values(schema.dict(exclude_none=True)))
+            result = self._reload(session, id)
             logger.bind(model=self.model.__name__, id=id).debug("update done")
             return result
 
     def update_attr(self, id: int, column: str, value: Any):
         with self.session_factory() as session:
             logger.bind(model=self.model.__name__, id=id, column=column).debug("update_attr start")
-            session.query(self.model).filter(self.model.id == id).update({column: value})
-            session.commit()
-            result = self.read_by_id(id)
+            session.execute(update(self.model).where(self.model.id == id).values({column: value}))
+            result = self._reload(session, id)
             logger.bind(model=self.model.__name__, id=id, column=column).debug("update_attr done")
             return result
 
     def whole_update(self, id: int, schema: T):
         with self.session_factory() as session:
             logger.bind(model=self.model.__name__, id=id).debug("whole_update start")
-            session.query(self.model).filter(self.model.id == id).update(schema.dict())
-            session.commit()
-            result = self.read_by_id(id)
+            session.execute(update(self.model).where(self.model.id == id).values(schema.dict()))
+            result = self._reload(session, id)
             logger.bind(model=self.model.__name__, id=id).debug("whole_update done")
             return result
 
     def delete_by_id(self, id: int):
         with self.session_factory() as session:
             logger.bind(model=self.model.__name__, id=id).debug("delete_by_id start")
-            query = session.query(self.model).filter(self.model.id == id).first()
+            query = session.execute(self._read_by_id_statement(id)).scalars().first()
             if not query:
                 raise NotFoundError(detail=f"not found id : {id}")
             session.delete(query)
-            session.commit()
+            session.flush()
             logger.bind(model=self.model.__name__, id=id).debug("delete_by_id done")
 
     def close_scoped_session(self):
         with self.session_factory() as session:
             return session.close()
+
+
+class AsyncBaseRepository(RepositoryStatements):
+    """asyncio twin of :class:`BaseRepository`.
+
+    Both build their statements through :class:`RepositoryStatements`, so the
+    two stacks issue the same SQL; only the execution is awaited.
+    """
+
+    def __init__(self, session_factory: Callable[..., AbstractAsyncContextManager[AsyncSession]], model: Type[T]) -> None:
+        super().__init__(session_factory, model)
+
+    async def read_by_options(self, schema: T, eager: bool = False) -> dict:
+        async with self.session_factory() as session:
+            logger.bind(model=self.model.__name__).debug("read_by_options start")
+            statement, count_statement, search_options = self._read_by_options_statements(schema, eager)
+            founds = (await session.execute(statement)).scalars()
+            founds = founds.unique().all() if eager else founds.all()
+            total_count = (await session.execute(count_statement)).scalar_one()
+            result = {
+                "founds": founds,
+                "search_options": {**search_options, "total_count": total_count},
+            }
+            logger.bind(model=self.model.__name__, count=len(founds)).debug("read_by_options done")
+            return result
+
+    async def read_by_id(self, id: int, eager: bool = False):
+        async with self.session_factory() as session:
+            logger.bind(model=self.model.__name__, id=id).debug("read_by_id start")
+            query = (await session.execute(self._read_by_id_statement(id, eager))).scalars().first()
+            if not query:
+                raise NotFoundError(detail=f"not found id : {id}")
+            logger.bind(model=self.model.__name__, id=id).debug("read_by_id done")
+            return query
+
+    async def create(self, schema: T):
+        async with self.session_factory() as session:
+            logger.bind(model=self.model.__name__).debug("create start")
+            query = self.model(**schema.dict())
+            try:
+                session.add(query)
+                await session.flush()
+                await session.refresh(query)
+            except IntegrityError as e:
+                logger.exception("create failed due to integrity error")
+                raise DuplicatedError(detail=str(e.orig))
+            logger.bind(model=self.model.__name__, id=query.id).debug("create done")
+            return query
+
+    async def update(self, id: int, schema: T):
+        return await self._update_values(id, schema.dict(exclude_none=True))
+
+    async def update_attr(self, id: int, column: str, value: Any):
+        return await self._update_values(id, {column: value})
+
+    async def whole_update(self, id: int, schema: T):
+        return await self._update_values(id, schema.dict())
+
+    async def _update_values(self, id: int, values: dict):
+        async with self.session_factory() as session:
+            logger.bind(model=self.model.__name__, id=id).debug("update start")
+            await session.execute(update(self.model).where(self.model.id == id).values(values))
+            result = (await session.execute(self._reload_statement(id))).scalars().first()
+            if not result:
+                raise NotFoundError(detail=f"not found id : {id}")
+            logger.bind(model=self.model.__name__, id=id).debug("update done")
+            return result
+
+    async def delete_by_id(self, id: int):
+        async with self.session_factory() as session:
+            logger.bind(model=self.model.__name__, id=id).debug("delete_by_id start")
+            result = await session.execute(delete(self.model).where(self.model.id == id))
+            if not result.rowcount:
+                raise NotFoundError(detail=f"not found id : {id}")
+            logger.bind(model=self.model.__name__, id=id).debug("delete_by_id done")
+
+    async def close_scoped_session(self):
+        async with self.session_factory() as session:
+            return await session.close()
@@ -1,12 +1,18 @@
-from contextlib import AbstractContextManager
+from contextlib import AbstractAsyncContextManager, AbstractContextManager
 from typing import Callable, List, Optional
 
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.repository.base_repository import BaseRepository
+from app.repository.base_repository import AsyncBaseRepository, BaseRepository
 from app.model.task import Task as TaskModel
 
 
+def _owned_by(task_id: int, user_id: int) -> tuple:
+    return TaskModel.id == task_id, TaskModel.id_usuario == user_id
+
+
 class TaskRepository(BaseRepository):
     def __init__(self, session_factory: Callable[..., AbstractContextManager[Session]]):
         super().__init__(session_factory, TaskModel)
@@ -30,9 +36,13 @@ class TaskRepository(BaseRepository):
                 .filter(self.model.id == task_id, self.model.id_usuario == user_id)
                 .update(values)
             )
-            session.commit()
             if updated:
-                return self.get_by_id_and_user(task_id, user_id)
+                return (
+                    session.query(self.model)
+                    .filter(self.model.id == task_id, self.model.id_usuario == user_id)
+                    .populate_existing()
+                    .first()
+                )
             return None
 
     def delete_by_id_and_user(self, task_id: int, user_id: int) -> bool:
@@ -45,5 +55,37 @@ class TaskRepository(BaseRepository):
             if not obj:
                 return False
             session.delete(obj)
-            session.commit()
+            session.flush()
             return True
+
+
+class AsyncTaskRepository(AsyncBaseRepository):
+    def __init__(self, session_factory: Callable[..., AbstractAsyncContextManager[AsyncSession]]):
+        super().__init__(session_factory, TaskModel)
+
+    async def list_by_user(self, user_id: int) -> List[TaskModel]:
+        async with self.session_factory() as session:
+            result = await session.execute(select(self.model).where(self.model.id_usuario == user_id))
+            return result.scalars().all()
+
+    async def get_by_id_and_user(self, task_id: int, user_id: int) -> Optional[TaskModel]:
+        async with self.session_factory() as session:
+            result = await session.execute(select(self.model).where(*_owned_by(task_id, user_id)))
+            return result.scalars().first()
+
+    async def update_by_id_and_user(self, task_id: int, user_id: int, values: dict) -> Optional[TaskModel]:
+        async with self.session_factory() as session:
+            result = await session.execute(update(self.model).where(*_owned_by(task_id, user_id)).values(values))
+            if result.rowcount:
+                reloaded = await session.execute(
+                    select(self.model)
+                    .where(*_owned_by(task_id, user_id))
+                    .execution_options(populate_existing=True)
+                )
+                return reloaded.scalars().first()
+            return None
+
+    async def delete_by_id_and_user(self, task_id: int, user_id: int) -> bool:
+        async with self.session_factory() as session:
+            result = await session.execute(delete(self.model).where(*_owned_by(task_id, user_id)))
+            return bool(result.rowcount)
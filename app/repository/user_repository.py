@@ -1,13 +1,19 @@
-from contextlib import AbstractContextManager
+from contextlib import AbstractAsyncContextManager, AbstractContextManager
 from typing import Callable
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.model.user import User
-from app.repository.base_repository import BaseRepository
+from app.repository.base_repository import AsyncBaseRepository, BaseRepository
 
 
 class UserRepository(BaseRepository):
     def __init__(self, session_factory: Callable[..., AbstractContextManager[Session]]):
         self.session_factory = session_factory
         super().__init__(session_factory, User)
+
+
+class AsyncUserRepository(AsyncBaseRepository):
+    def __init__(self, session_factory: Callable[..., AbstractAsyncContextManager[AsyncSession]]):
+        super().__init__(session_factory, User)
@@ -7,7 +7,7 @@ from app.core.security import create_access_token, get_password_hash, verify_pas
 from app.model.user import User
 from app.repository.user_repository import UserRepository
 from app.schema.auth_schema import Payload, SignIn, SignUp
-from app.schema.user_schema import FindUser
+from app.schema.user_schema import FindUser, User as UserSchema
 from app.services.base_service import BaseService
 from app.util.hash import get_rand_hash
 from loguru import logger
@@ -33,7 +33,6 @@ class AuthService(BaseService):
         if not verify_password(sign_in_info.password, found_user.password):
             logger.bind(user_id=found_user.id).warning("Auth: invalid password")
             raise AuthError(detail="Incorrect email or password")
-        delattr(found_user, "password")
         payload = Payload(
             id=found_user.id,
             email=found_user.email,
@@ -45,7 +44,9 @@ class AuthService(BaseService):
         sign_in_result = {
             "access_token": access_token,
             "expiration": expiration_datetime,
-            "user_info": found_user,
+            # a schema copy, so the password hash never reaches the response
+            # and the (possibly still attached) ORM instance is left untouched
+            "user_info": UserSchema.model_validate(found_user),
         }
         logger.bind(user_id=found_user.id).info("Auth: sign_in success")
         return sign_in_result
@@ -60,7 +61,6 @@ class AuthService(BaseService):
             user_token=user_token,
         )
         user.password = get_password_hash(user_info.password)
-        created_user = self.user_repository.create(user)
-        delattr(created_user, "password")
+        created_user = UserSchema.model_validate(self.user_repository.create(user))
         logger.bind(user_id=created_user.id).info("Auth: sign_up success")
         return created_user
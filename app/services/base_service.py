@@ -44,3 +44,35 @@ class BaseService:
 
     def close_scoped_session(self):
         self._repository.close_scoped_session()
+
+
+class AsyncBaseService:
+    """asyncio counterpart of :class:`BaseService`; a sibling, not a subclass,
+    so nothing expecting the sync API receives coroutines."""
+
+    def __init__(self, repository: Any) -> None:
+        self._repository = repository
+
+    async def get_list(self, schema: Any) -> Any:
+        return await self._repository.read_by_options(schema)
+
+    async def get_by_id(self, id: int) -> Any:
+        return await self._repository.read_by_id(id)
+
+    async def add(self, schema: Any) -> Any:
+        return await self._repository.create(schema)
+
+    async def patch(self, id: int, schema: Any) -> Any:
+        return await self._repository.update(id, schema)
+
+    async def patch_attr(self, id: int, attr: str, value: Any) -> Any:
+        return await self._repository.update_attr(id, attr, value)
+
+    async def put_update(self, id: int, schema: Any) -> Any:
+        return await self._repository.whole_update(id, schema)
+
+    async def remove_by_id(self, id: int) -> Any:
+        return await self._repository.delete_by_id(id)
+
+    async def close_scoped_session(self):
+        await self._repository.close_scoped_session()
@@ -2,7 +2,28 @@ from typing import List, Optional
 from datetime import datetime
 
 from app.schema.task_schema import Task, UpsertTask
-from app.repository.task_repository import TaskRepository
+from app.repository.task_repository import AsyncTaskRepository, TaskRepository
+
+
+def _new_task(task_data: UpsertTask, user_id: int) -> Task:
+    return Task(
+        titulo=task_data.titulo,
+        descripcion=task_data.descripcion,
+        estado=task_data.estado or "pendiente",
+        fecha_creacion=datetime.utcnow(),
+        id_usuario=user_id,
+    )
+
+
+def _changed_values(task_data: UpsertTask) -> dict:
+    values = {}
+    if task_data.titulo is not None:
+        values["titulo"] = task_data.titulo
+    if task_data.descripcion is not None:
+        values["descripcion"] = task_data.descripcion
+    if task_data.estado is not None:
+        values["estado"] = task_data.estado
+    return values
 
 
 class TaskService:
@@ -10,14 +31,7 @@ class TaskService:
         self.task_repository = task_repository
 
     def create_task(self, task_data: UpsertTask, user_id: int) -> Task:
-        payload = Task(
-            titulo=task_data.titulo,
-            descripcion=task_data.descripcion,
-            estado=task_data.estado or "pendiente",
-            fecha_creacion=datetime.utcnow(),
-            id_usuario=user_id,
-        )
-        return self.task_repository.create(payload)
+        return self.task_repository.create(_new_task(task_data, user_id))
 
     def list_tasks(self, user_id: int) -> List[Task]:
         return self.task_repository.list_by_user(user_id)
@@ -26,16 +40,33 @@ class TaskService:
         return self.task_repository.get_by_id_and_user(task_id, user_id)
 
     def update_task(self, task_id: int, task_data: UpsertTask, user_id: int) -> Optional[Task]:
-        values = {}
-        if task_data.titulo is not None:
-            values["titulo"] = task_data.titulo
-        if task_data.descripcion is not None:
-            values["descripcion"] = task_data.descripcion
-        if task_data.estado is not None:
-            values["estado"] = task_data.estado
+        values = _changed_values(task_data)
         if not values:
             return self.get_task(task_id, user_id)
         return self.task_repository.update_by_id_and_user(task_id, user_id, values)
 
     def delete_task(self, task_id: int, user_id: int) -> bool:
         return self.task_repository.delete_by_id_and_user(task_id, user_id)
+
+
+class AsyncTaskService:
+    def __init__(self, task_repository: AsyncTaskRepository):
+        self.task_repository = task_repository
+
+    async def create_task(self, task_data: UpsertTask, user_id: int) -> Task:
+        return await self.task_repository.create(_new_task(task_data, user_id))
+
+    async def list_tasks(self, user_id: int) -> List[Task]:
+        return await self.task_repository.list_by_user(user_id)
+
+    async def get_task(self, task_id: int, user_id: int) -> Optional[Task]:
+        return await self.task_repository.get_by_id_and_user(task_id, user_id)
+
+    async def update_task(self, task_id: int, task_data: UpsertTask, user_id: int) -> Optional[Task]:
+        values = _changed_values(task_data)
+        if not values:
+            return await self.get_task(task_id, user_id)
+        return await self.task_repository.update_by_id_and_user(task_id, user_id, values)
+
+    async def delete_task(self, task_id: int, user_id: int) -> bool:
+        return await self.task_repository.delete_by_id_and_user(task_id, user_id)
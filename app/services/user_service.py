@@ -1,8 +1,14 @@
-from app.repository.user_repository import UserRepository
-from app.services.base_service import BaseService
+from app.repository.user_repository import AsyncUserRepository, UserRepository
+from app.services.base_service import AsyncBaseService, BaseService
 
 
 class UserService(BaseService):
     def __init__(self, user_repository: UserRepository):
         self.user_repository = user_repository
         super().__init__(user_repository)
+
+
+class AsyncUserService(AsyncBaseService):
+    def __init__(self, user_repository: AsyncUserRepository):
+        self.user_repository = user_repository
+        super().__init__(user_repository)
@@ -0,0 +1,90 @@
+import asyncio
+
+from app.core.config import configs
+from app.core.database import Database
+from app.repository.task_repository import AsyncTaskRepository
+from app.schema.task_schema import UpsertTask
+from app.services.task_service import AsyncTaskService
+
+
+def test_async_task_service_crud_flow(client):
+    r = client.post("/api/v2/auth/sign-up", json={"email": "async@tasks.com", "password": "pass", "name": "a"})
+    assert r.status_code == 200
+    user_id = r.json()["id"]
+
+    async def flow():
+        db = Database(configs.DATABASE_URI, async_db_url=configs.ASYNC_DATABASE_URI)
+        service = AsyncTaskService(AsyncTaskRepository(session_factory=db.async_session))
+        try:
+            created = await service.create_task(UpsertTask(titulo="t1", descripcion="d1"), user_id)
+            assert created.id > 0
+            assert created.estado == "pendiente"
+
+            tasks = await service.list_tasks(user_id)
+            assert [t.id for t in tasks] == [created.id]
+
+            updated = await service.update_task(created.id, UpsertTask(estado="completada"), user_id)
+            assert updated.estado == "completada"
+            assert updated.titulo == "t1"
+
+            # other users can neither see nor touch the task
+            assert await service.get_task(created.id, user_id + 1) is None
+            assert await service.delete_task(created.id, user_id + 1) is False
+
+            assert await service.delete_task(created.id, user_id) is True
+            assert await service.get_task(created.id, user_id) is None
+        finally:
+            await db.disconnect()
+
+    asyncio.run(flow())
+
+
+def test_async_task_routes_crud_flow(client, monkeypatch):
+    import importlib
+    import inspect
+
+    from dependency_injector import providers
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    import app.api.v1.routes as v1_routes
+    from app.api.v2.routes import routers as v2_routers
+    from app.core.container import Container
+
+    # mount the v1 routers the way DB_ASYNC=true does, against an async-enabled database
+    monkeypatch.setattr(configs, "DB_ASYNC", True)
+    async_routers = importlib.reload(v1_routes).routers
+    monkeypatch.undo()
+    assert all(inspect.iscoroutinefunction(route.endpoint) for route in async_routers.routes)
+    importlib.reload(v1_routes)
+
+    container = Container()
+    db = Database(configs.DATABASE_URI, async_db_url=configs.ASYNC_DATABASE_URI)
+    container.db.override(providers.Object(db))
+    async_app = FastAPI()
+    async_app.include_router(async_routers, prefix=configs.API_V1_STR)
+    async_app.include_router(v2_routers, prefix=configs.API_V2_STR)
+
+    try:
+        with TestClient(async_app) as async_client:
+            r = async_client.post("/api/v2/auth/sign-up", json={"email": "async@routes.com", "password": "p", "name": "a"})
+            assert r.status_code == 200
+            r = async_client.post("/api/v2/auth/sign-in", json={"email__eq": "async@routes.com", "password": "p"})
+            headers = {"Authorization": f"Bearer {r.json()['access_token']}"}
+
+            r = async_client.post("/api/v1/tasks", json={"titulo": "t1", "descripcion": "d1"}, headers=headers)
+            assert r.status_code == 201
+            task_id = r.json()["id"]
+
+            r = async_client.get("/api/v1/tasks", headers=headers)
+            assert [t["id"] for t in r.json()] == [task_id]
+
+            r = async_client.put(f"/api/v1/tasks/{task_id}", json={"estado": "completada"}, headers=headers)
+            assert r.status_code == 200
+            assert r.json()["estado"] == "completada"
+
+            assert async_client.delete(f"/api/v1/tasks/{task_id}", headers=headers).status_code == 204
+            assert async_client.get(f"/api/v1/tasks/{task_id}", headers=headers).status_code == 404
+    finally:
+        container.db.reset_override()
+        asyncio.run(db.disconnect())
@@ -2,3 +2,23 @@ def test_client(client):
     response = client.get("/")
     assert response.status_code == 200
     assert response.json() == "service is working"
+
+
+
+def test_pool_stats_requires_super_user(client):
+    from app.core.security import create_access_token
+
+    assert client.get("/pool-stats").status_code == 403
+
+    token, _ = create_access_token({"id": 1, "email": "test1@test1.com", "name": "test1", "is_superuser": False})
+    response = client.get("/pool-stats", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 403
+
+    token, _ = create_access_token(
+        {"id": 3, "email": "test_super@test_super.com", "name": "test_super", "is_superuser": True}
+    )
+    response = client.get("/pool-stats", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 200
+    stats = response.json()["sync"]
+    assert stats["checkouts"] >= 1
+    assert stats["checkout_latency_ms"]["+Inf"] == stats["checkouts"]
@@ -0,0 +1,56 @@
+import pytest
+from sqlalchemy import event
+
+from app.schema.auth_schema import SignIn, SignUp
+
+
+def test_sign_up_and_sign_in_inside_unit_of_work(client, container):
+    db = container.db()
+    auth_service = container.auth_service()
+
+    with db.unit_of_work():
+        created = auth_service.sign_up(SignUp(email="uow@test.com", password="pass", name="uow"))
+    assert created.id > 0
+
+    with db.unit_of_work():
+        signed_in = auth_service.sign_in(SignIn(email__eq="uow@test.com", password="pass"))
+    assert signed_in["user_info"].id == created.id
+    assert not hasattr(signed_in["user_info"], "password")
+
+    # the sign-up was committed, not rolled back
+    assert container.user_service().get_by_id(created.id).email == "uow@test.com"
+
+
+def test_unit_of_work_rolls_back_on_error(client, container):
+    db = container.db()
+    auth_service = container.auth_service()
+
+    with pytest.raises(RuntimeError):
+        with db.unit_of_work():
+            auth_service.sign_up(SignUp(email="rollback@test.com", password="pass", name="r"))
+            raise RuntimeError("boom")
+
+    with pytest.raises(Exception):
+        with db.unit_of_work():
+            auth_service.sign_in(SignIn(email__eq="rollback@test.com", password="pass"))
+
+
+def test_unit_of_work_commits_once(client, container):
+    db = container.db()
+    commits = []
+    event.listen(db._engine, "commit", lambda conn: commits.append(conn))
+
+    with db.unit_of_work():
+        user = container.auth_service().sign_up(SignUp(email="once@test.com", password="pass", name="o"))
+        container.user_service().patch_attr(user.id, "name", "renamed")
+    assert len(commits) == 1
+    assert container.user_service().get_by_id(user.id).name == "renamed"
+
+
+def test_read_only_session_does_not_commit(client, container):
+    db = container.db()
+    commits = []
+    event.listen(db._engine, "commit", lambda conn: commits.append(conn))
+
+    container.user_service().get_by_id(1)
+    assert commits == []
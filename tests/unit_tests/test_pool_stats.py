@@ -0,0 +1,46 @@
+import threading
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app.core.config import configs
+from app.core.database import Database
+
+
+def test_uncontended_checkouts_do_not_wait():
+    db = Database(configs.DATABASE_URI, pool_size=1, max_overflow=1)
+    try:
+        with db._engine.connect():
+            # the second one opens an overflow connection without blocking
+            with db._engine.connect():
+                pass
+        stats = db.pool_status()["sync"]
+        assert stats["checkouts"] == 2
+        assert stats["waits"] == 0
+        assert stats["wait_time_ms"] == 0
+    finally:
+        db._engine.dispose()
+
+
+def test_checkout_at_capacity_waits():
+    db = Database(configs.DATABASE_URI, pool_size=1, max_overflow=0, pool_timeout=0.2)
+    try:
+        with db._engine.connect():
+            errors = []
+
+            def checkout():
+                try:
+                    with db._engine.connect():
+                        pass
+                except PoolTimeoutError as e:
+                    errors.append(e)
+
+            thread = threading.Thread(target=checkout)
+            thread.start()
+            thread.join()
+            assert len(errors) == 1
+        stats = db.pool_status()["sync"]
+        assert stats["waits"] == 1
+        assert stats["timeouts"] == 1
+        assert stats["max_wait_ms"] >= 150
+    finally:
+        db._engine.dispose()